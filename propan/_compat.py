@@ -1,7 +1,7 @@
 import importlib.util
 import json
 import sys
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Type, Union
 
 from fast_depends._compat import PYDANTIC_V2, FieldInfo
 from pydantic import BaseModel
@@ -132,3 +132,43 @@ else:
 
     def model_copy(model: BaseModel, **kwargs: AnyDict) -> AnyDict:
         return model.copy(**kwargs)
+
+
+def _json_dumps(data: Any) -> bytes:
+    return dump_json(data).encode()
+
+
+if is_installed("orjson"):
+    import orjson
+
+    # orjson rejects integers over 64 bits and NaN / Infinity literals,
+    # such payloads are handled by the stdlib json module instead.
+    # NaN and Infinity floats are still encoded as `null` by orjson.
+
+    if PYDANTIC_V2:
+
+        def _orjson_dumps(data: Any) -> bytes:
+            return orjson.dumps(model_to_jsonable(data), option=orjson.OPT_NON_STR_KEYS)
+
+    else:
+
+        def _orjson_dumps(data: Any) -> bytes:
+            return orjson.dumps(
+                data, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS
+            )
+
+    def json_dumps(data: Any) -> bytes:
+        try:
+            return _orjson_dumps(data)
+        except orjson.JSONEncodeError:
+            return _json_dumps(data)
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+else:
+    json_dumps = _json_dumps
+    json_loads = json.loads
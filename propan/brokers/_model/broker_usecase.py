@@ -1,4 +1,3 @@
-import json
 import logging
 import warnings
 from abc import ABC, abstractmethod
@@ -26,6 +25,7 @@ from fast_depends.core import CallModel, build_call_model
 from fast_depends.dependencies import Depends
 from typing_extensions import Self, TypeAlias, TypeVar
 
+from propan._compat import json_loads
 from propan.brokers._model.routing import BrokerRouter
 from propan.brokers._model.schemas import BaseHandler, PropanMessage
 from propan.brokers._model.utils import (
@@ -132,7 +132,7 @@ class BrokerUsecase(ABC, Generic[MsgType, ConnectionType]):
         self._is_apply_types = apply_types
         self.handlers = []
         self.dependencies = dependencies
-        self.middlewares = middlewares
+        self.middlewares = tuple(middlewares)
 
         self._connection_args = args
         self._connection_kwargs = kwargs
@@ -151,16 +151,13 @@ class BrokerUsecase(ABC, Generic[MsgType, ConnectionType]):
     def _resolve_connection_kwargs(self, *args: Any, **kwargs: AnyDict) -> AnyDict:
         arguments = get_function_positional_arguments(self.__init__)  # type: ignore
 
-        init_kwargs = {
-            **self._connection_kwargs,
-            **dict(zip(arguments, self._connection_args)),
-        }
-
-        connect_kwargs = {
-            **kwargs,
-            **dict(zip(arguments, args)),
-        }
-        return {**init_kwargs, **connect_kwargs}
+        connect_kwargs = dict(self._connection_kwargs)
+        connect_kwargs.update(zip(arguments, self._connection_args))
+        if kwargs:
+            connect_kwargs.update(kwargs)
+        if args:
+            connect_kwargs.update(zip(arguments, args))
+        return connect_kwargs
 
     @staticmethod
     def _decode_message(message: PropanMessage[Any]) -> DecodedMessage:
@@ -170,7 +167,7 @@ class BrokerUsecase(ABC, Generic[MsgType, ConnectionType]):
             if ContentTypes.text.value in message.content_type:
                 m = body.decode()
             elif ContentTypes.json.value in message.content_type:  # pragma: no branch
-                m = json.loads(body.decode())
+                m = json_loads(body)
         return m
 
     @staticmethod
@@ -550,25 +547,42 @@ class BrokerAsyncUsecase(BrokerUsecase[MsgType, ConnectionType]):
         _raw: bool = False,
     ) -> Callable[[PropanMessage[MsgType]], Awaitable[T_HandlerReturn]]:
         is_unwrap = len(params) > 1
+        default_decoder = self._decode_message
 
-        @wraps(func)
-        async def wrapper(message: PropanMessage[MsgType]) -> T_HandlerReturn:
-            if decoder is not None:
-                msg = await decoder(message, self._decode_message)
-            else:
-                msg = await self._decode_message(message)
+        # select the decoding and calling strategy once instead of per message
+        decode: Callable[[PropanMessage[MsgType]], Awaitable[DecodedMessage]]
+        if decoder is None:
+            decode = default_decoder
+        else:
+
+            def decode(
+                message: PropanMessage[MsgType],
+            ) -> Awaitable[DecodedMessage]:
+                return decoder(message, default_decoder)  # type: ignore[misc]
 
-            message.decoded_body = msg
-            if _raw is True:
+        wrapper: Callable[[PropanMessage[MsgType]], Awaitable[T_HandlerReturn]]
+        if _raw is True:
+
+            @wraps(func)
+            async def wrapper(message: PropanMessage[MsgType]) -> T_HandlerReturn:
+                message.decoded_body = await decode(message)
                 return await func(message)
 
-            elif is_unwrap is True:
+        elif is_unwrap is True:
+
+            @wraps(func)
+            async def wrapper(message: PropanMessage[MsgType]) -> T_HandlerReturn:
+                msg = message.decoded_body = await decode(message)
                 if isinstance(msg, Mapping):
                     return await func(**msg)
                 else:
                     return await func(*msg)
 
-            else:
+        else:
+
+            @wraps(func)
+            async def wrapper(message: PropanMessage[MsgType]) -> T_HandlerReturn:
+                msg = message.decoded_body = await decode(message)
                 return await func(msg)
 
         return wrapper
@@ -643,8 +657,12 @@ class BrokerAsyncUsecase(BrokerUsecase[MsgType, ConnectionType]):
     ) -> Callable[[PropanMessage[MsgType]], Awaitable[T_HandlerReturn]]:
         @wraps(func)
         async def middleware_wrapper(msg: PropanMessage[MsgType]) -> T_HandlerReturn:
+            middlewares = self.middlewares
+            if not middlewares:
+                return await func(msg)
+
             async with AsyncExitStack() as stack:
-                for m in self.middlewares:
+                for m in middlewares:
                     await stack.enter_async_context(m(msg))
                 return await func(msg)
 
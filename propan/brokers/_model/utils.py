@@ -1,15 +1,18 @@
 import logging
 from functools import wraps
-from typing import Awaitable, Callable, Optional, Tuple, TypeVar, Union, cast
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar, Union, cast
 
-from propan._compat import dump_json
+from pydantic import BaseModel
+
+from propan._compat import json_dumps, model_to_json
+from propan.brokers._model.schemas import PropanMessage
 from propan.brokers.constants import ContentType, ContentTypes
 from propan.brokers.push_back_watcher import (
     BaseWatcher,
     FakePushBackWatcher,
     PushBackWatcher,
 )
-from propan.types import SendableMessage
+from propan.types import DecodedMessage, SendableMessage
 from propan.utils import context
 
 
@@ -23,12 +26,24 @@ def to_send(msg: SendableMessage) -> Tuple[bytes, Optional[ContentType]]:
     if isinstance(msg, str):
         return msg.encode(), ContentTypes.text.value
 
+    if isinstance(msg, BaseModel):
+        # serialize the model directly instead of going through a dict
+        return model_to_json(msg).encode(), ContentTypes.json.value
+
     return (
-        dump_json(msg).encode(),
+        json_dumps(msg),
         ContentTypes.json.value,
     )
 
 
+async def skip_decode(
+    message: PropanMessage[Any],
+    original_decoder: Callable[[PropanMessage[Any]], Awaitable[DecodedMessage]],
+) -> None:
+    # RPC response consumers decode only the messages matched by correlation id
+    return None
+
+
 def change_logger_handlers(logger: logging.Logger, fmt: str) -> None:
     for handler in logger.handlers:
         formatter = handler.formatter
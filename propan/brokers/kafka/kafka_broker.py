@@ -32,6 +32,7 @@ from propan.brokers._model.broker_usecase import (
     T_HandlerReturn,
 )
 from propan.brokers._model.schemas import PropanMessage
+from propan.brokers._model.utils import skip_decode
 from propan.brokers.exceptions import SkipMessage
 from propan.brokers.kafka.schemas import Handler
 from propan.brokers.push_back_watcher import BaseWatcher
@@ -228,6 +229,7 @@ class KafkaBroker(
                 self.response_topic,
                 _raw=True,
                 enable_auto_commit=False,
+                decode_message=skip_decode,
             )(self._consume_response)
 
         context.set_local(
@@ -1,6 +1,11 @@
 from propan.brokers.rabbit.rabbit_broker import RabbitBroker, RabbitMessage
 from propan.brokers.rabbit.routing import RabbitRouter
-from propan.brokers.rabbit.schemas import ExchangeType, RabbitExchange, RabbitQueue
+from propan.brokers.rabbit.schemas import (
+    BulkConfig,
+    ExchangeType,
+    RabbitExchange,
+    RabbitQueue,
+)
 
 __all__ = (
     "RabbitBroker",
@@ -8,5 +13,6 @@ __all__ = (
     "RabbitRouter",
     "RabbitExchange",
     "ExchangeType",
+    "BulkConfig",
     "RabbitMessage",
 )
@@ -15,11 +15,10 @@ class RabbitLoggingMixin:
         queue: RabbitQueue,
         exchange: Optional[RabbitExchange] = None,
     ) -> AnyDict:
-        context = {
-            "queue": queue.name,
-            "exchange": exchange.name if exchange else "default",
-            **super()._get_log_context(message),
-        }
+        # called for each message, so extend the base context in place
+        context = super()._get_log_context(message)
+        context["queue"] = queue.name
+        context["exchange"] = exchange.name if exchange else "default"
         return context
 
     @property
@@ -1,11 +1,13 @@
-from contextlib import asynccontextmanager
+import asyncio
 from functools import wraps
+from itertools import cycle
 from types import TracebackType
 from typing import (
     Any,
     Awaitable,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -20,33 +22,53 @@ import aio_pika
 import aiormq
 import anyio
 from aio_pika.abc import DeliveryMode
-from anyio.streams.memory import MemoryObjectReceiveStream
 from fast_depends.dependencies import Depends
 from typing_extensions import TypeAlias
 from yarl import URL
 
 from propan._compat import model_to_dict
 from propan.brokers._model.broker_usecase import (
+    AsyncDecoder,
+    AsyncParser,
     BrokerAsyncUsecase,
     HandlerCallable,
     T_HandlerReturn,
 )
 from propan.brokers._model.schemas import PropanMessage
 from propan.brokers.exceptions import WRONG_PUBLISH_ARGS
-from propan.brokers.push_back_watcher import BaseWatcher, WatcherContext
+from propan.brokers.push_back_watcher import (
+    BaseWatcher,
+    NotPushBackWatcher,
+    WatcherContext,
+)
 from propan.brokers.rabbit.logging import RabbitLoggingMixin
-from propan.brokers.rabbit.schemas import Handler, RabbitExchange, RabbitQueue
-from propan.brokers.rabbit.utils import validate_exchange, validate_queue
-from propan.types import AnyDict, SendableMessage
+from propan.brokers.rabbit.schemas import (
+    BulkConfig,
+    Handler,
+    RabbitExchange,
+    RabbitQueue,
+)
+from propan.brokers.rabbit.utils import (
+    get_cached_exchange,
+    get_cached_queue,
+    validate_exchange,
+    validate_queue,
+)
+from propan.types import AnyDict, DecodedMessage, SendableMessage
 from propan.utils import context
 
 TimeoutType = Optional[Union[int, float]]
 PikaSendableMessage: TypeAlias = Union[aio_pika.message.Message, SendableMessage]
 RabbitMessage: TypeAlias = PropanMessage[aio_pika.message.IncomingMessage]
 T = TypeVar("T")
+CorrelationId: TypeAlias = str
 
 RABBIT_REPLY = "amq.rabbitmq.reply-to"
 
+# broker-level log context placeholders
+EMPTY_QUEUE = RabbitQueue("")
+EMPTY_EXCHANGE = RabbitExchange("")
+
 
 class RabbitBroker(
     RabbitLoggingMixin,
@@ -55,9 +77,18 @@ class RabbitBroker(
     handlers: List[Handler]
     _connection: Optional[aio_pika.RobustConnection]
     _channel: Optional[aio_pika.RobustChannel]
+    _handler_channels: List[aio_pika.RobustChannel]
+    _bulk_tasks: List["asyncio.Task[None]"]
+    _publish_channels: List[aio_pika.RobustChannel]
+    _publish_pool: Optional[Iterator[aio_pika.RobustChannel]]
+    _publish_exchanges: Dict[
+        Tuple[aio_pika.RobustChannel, str], aio_pika.abc.AbstractExchange
+    ]
     _queues: Dict[RabbitQueue, aio_pika.RobustQueue]
     _exchanges: Dict[RabbitExchange, aio_pika.RobustExchange]
     _rpc_lock: anyio.Lock
+    _rpc_queue: Optional[aio_pika.RobustQueue]
+    response_callbacks: Dict[CorrelationId, "asyncio.Future[RabbitMessage]"]
 
     def __init__(
         self,
@@ -65,6 +96,7 @@ class RabbitBroker(
         *,
         log_fmt: Optional[str] = None,
         consumers: Optional[int] = None,
+        publish_channels: Optional[int] = None,
         protocol: str = "amqp",
         protocol_version: str = "0.9.1",
         **kwargs: AnyDict,
@@ -78,9 +110,17 @@ class RabbitBroker(
             **kwargs,
         )
         self._max_consumers = consumers
+        self._max_publish_channels = publish_channels
 
         self._channel = None
+        self._handler_channels = []
+        self._bulk_tasks = []
+        self._publish_channels = []
+        self._publish_pool = None
+        self._publish_exchanges = {}
         self._rpc_lock = anyio.Lock()
+        self._rpc_queue = None
+        self.response_callbacks = {}
 
         self._max_queue_len = 4
         self._max_exchange_len = 4
@@ -94,6 +134,26 @@ class RabbitBroker(
         exec_tb: Optional[TracebackType] = None,
     ) -> None:
         await super().close(exc_type, exc_val, exec_tb)
+
+        for t in self._bulk_tasks:
+            t.cancel()
+        self._bulk_tasks = []
+
+        for f in self.response_callbacks.values():
+            f.cancel()
+        self.response_callbacks = {}
+        self._rpc_queue = None
+
+        self._publish_pool = None
+        self._publish_exchanges = {}
+        for ch in self._publish_channels:
+            await ch.close()
+        self._publish_channels = []
+
+        for ch in self._handler_channels:
+            await ch.close()
+        self._handler_channels = []
+
         if self._channel is not None:
             await self._channel.close()
             self._channel = None
@@ -116,10 +176,23 @@ class RabbitBroker(
             self._channel = await connection.channel()
 
             if max_consumers:
-                c = self._get_log_context(None, RabbitQueue(""), RabbitExchange(""))
+                c = self._get_log_context(None, EMPTY_QUEUE, EMPTY_EXCHANGE)
                 self._log(f"Set max consumers to {max_consumers}", extra=c)
                 await self._channel.set_qos(prefetch_count=int(max_consumers))
 
+            if self._max_publish_channels:
+                # publishes are spread over their own channels round-robin,
+                # so they do not queue up behind each other and consumer acks
+                self._publish_channels = list(
+                    await asyncio.gather(
+                        *(
+                            connection.channel()
+                            for _ in range(self._max_publish_channels)
+                        )
+                    )
+                )
+                self._publish_pool = cycle(self._publish_channels)
+
         return connection
 
     def handle(
@@ -128,6 +201,8 @@ class RabbitBroker(
         exchange: Union[str, RabbitExchange, None] = None,
         *,
         consume_arguments: Optional[AnyDict] = None,
+        prefetch_count: Optional[int] = None,
+        bulk: Optional[BulkConfig] = None,
         dependencies: Sequence[Depends] = (),
         description: str = "",
         **original_kwargs: AnyDict,
@@ -141,6 +216,14 @@ class RabbitBroker(
 
         self._setup_log_context(queue, exchange)
 
+        if bulk is not None:
+            original_kwargs["parse_message"] = self._bulk_parser(
+                original_kwargs.get("parse_message")
+            )
+            original_kwargs["decode_message"] = self._bulk_decoder(
+                original_kwargs.get("decode_message")
+            )
+
         def wrapper(
             func: HandlerCallable[T_HandlerReturn],
         ) -> Callable[
@@ -159,6 +242,8 @@ class RabbitBroker(
                 exchange=exchange,
                 _description=description,
                 consume_arguments=consume_arguments,
+                prefetch_count=prefetch_count,
+                bulk=bulk,
                 dependant=dependant,
             )
             self.handlers.append(handler)
@@ -170,20 +255,44 @@ class RabbitBroker(
     async def start(self) -> None:
         context.set_local(
             "log_context",
-            self._get_log_context(None, RabbitQueue(""), RabbitExchange("")),
+            self._get_log_context(None, EMPTY_QUEUE, EMPTY_EXCHANGE),
         )
 
         await super().start()
 
         for handler in self.handlers:
-            queue = await self._init_handler(handler)
+            prefetch_count = handler.prefetch_count
+            if prefetch_count is None and handler.bulk is not None:
+                prefetch_count = handler.bulk.max_size
+
+            if prefetch_count is None:
+                channel = None
+            else:
+                # QoS is per channel and a robust channel restores only the
+                # last one set, so such handlers consume on their own channel.
+                # It also keeps bulk acks with `multiple=True` from settling
+                # deliveries of other consumers.
+                channel = await self._connection.channel()
+                await channel.set_qos(prefetch_count=prefetch_count)
+                self._handler_channels.append(channel)
+
+            queue = await self._init_handler(handler, channel)
 
             func = handler.callback
 
             c = self._get_log_context(None, handler.queue, handler.exchange)
             self._log(f"`{func.__name__}` waiting for messages", extra=c)
 
-            await queue.consume(func, arguments=handler.consume_arguments)
+            if handler.bulk is None:
+                await queue.consume(func, arguments=handler.consume_arguments)
+            else:
+                messages: "asyncio.Queue[aio_pika.IncomingMessage]" = asyncio.Queue()
+                await queue.consume(messages.put, arguments=handler.consume_arguments)
+                self._bulk_tasks.append(
+                    asyncio.create_task(
+                        self._consume_bulks(func, messages, handler.bulk)
+                    )
+                )
 
     async def publish(
         self,
@@ -202,32 +311,44 @@ class RabbitBroker(
         reply_to: Optional[str] = None,
         **message_kwargs,
     ) -> Union[aiormq.abc.ConfirmationFrameType, Dict, str, bytes, None]:
-        if self._channel is None:
+        channel = self._channel
+        if channel is None:
             raise ValueError("RabbitBroker channel not started yet")
 
-        queue, exchange = validate_queue(queue), validate_exchange(exchange)
+        queue, exchange = get_cached_queue(queue), get_cached_exchange(exchange)
 
         if callback is True:
             if reply_to is not None:
                 raise WRONG_PUBLISH_ARGS
             else:
-                context = RPCCallback(self._rpc_lock, self)
+                await self._init_rpc_consumer()
+                reply_to = RABBIT_REPLY
+                # Direct Reply-to requires publishing from the consumer channel
+                exchange_obj = await self._get_exchange(channel, exchange)
         else:
-            context = fake_context(reply_to)
+            exchange_obj = await self._get_exchange(
+                self._get_publish_channel(), exchange
+            )
 
-        if exchange is None:
-            exchange_obj = self._channel.default_exchange
-        else:
-            exchange_obj = await self.declare_exchange(exchange)
+        message = self._validate_message(
+            message=message,
+            persist=persist,
+            reply_to=reply_to,
+            **message_kwargs,
+        )
 
-        async with context as (reply_to, response_queue):
-            message = self._validate_message(
-                message=message,
-                persist=persist,
-                reply_to=reply_to,
-                **message_kwargs,
-            )
+        response_future: Optional["asyncio.Future[RabbitMessage]"]
+        if callback is True:
+            if message.correlation_id is None:
+                message.correlation_id = str(uuid4())
+            correlation_id = message.correlation_id
+
+            response_future = asyncio.Future()
+            self.response_callbacks[correlation_id] = response_future
+        else:
+            response_future = None
 
+        try:
             r = await exchange_obj.publish(
                 message=message,
                 routing_key=routing_key or queue.routing or "",
@@ -236,27 +357,177 @@ class RabbitBroker(
                 timeout=timeout,
             )
 
-            if response_queue is None:
+            if response_future is None:
                 return r
 
+            if raise_timeout:
+                scope = anyio.fail_after
             else:
-                if raise_timeout:
-                    scope = anyio.fail_after
-                else:
-                    scope = anyio.move_on_after
+                scope = anyio.move_on_after
+
+            msg: Any = None
+            with scope(callback_timeout):
+                msg = await response_future
+
+        finally:
+            if response_future is not None:
+                self.response_callbacks.pop(correlation_id, None)
 
-                msg: Any = None
-                with scope(callback_timeout):
-                    msg = await response_queue.receive()
+        if msg:
+            return await self._decode_message(msg)
+
+    async def publish_batch(
+        self,
+        *messages: PikaSendableMessage,
+        queue: Union[RabbitQueue, str] = "",
+        exchange: Union[RabbitExchange, str, None] = None,
+        routing_key: str = "",
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: TimeoutType = None,
+        persist: bool = False,
+        **message_kwargs,
+    ) -> List[aiormq.abc.ConfirmationFrameType]:
+        if self._channel is None:
+            raise ValueError("RabbitBroker channel not started yet")
+
+        queue, exchange = get_cached_queue(queue), get_cached_exchange(exchange)
+        exchange_obj = await self._get_exchange(self._get_publish_channel(), exchange)
+
+        routing = routing_key or queue.routing or ""
+
+        # send all messages first and wait for their confirmations together
+        return await asyncio.gather(
+            *(
+                exchange_obj.publish(
+                    message=self._validate_message(
+                        message=m,
+                        persist=persist,
+                        **message_kwargs,
+                    ),
+                    routing_key=routing,
+                    mandatory=mandatory,
+                    immediate=immediate,
+                    timeout=timeout,
+                )
+                for m in messages
+            )
+        )
+
+    def _get_publish_channel(self) -> aio_pika.RobustChannel:
+        if self._publish_pool is None:
+            return self._channel
+        return next(self._publish_pool)
+
+    async def _get_exchange(
+        self,
+        channel: aio_pika.RobustChannel,
+        exchange: Optional[RabbitExchange],
+    ) -> aio_pika.abc.AbstractExchange:
+        if exchange is None:
+            return channel.default_exchange
 
-                if msg:
-                    return await self._decode_message(msg)
+        exchange_obj = await self.declare_exchange(exchange)
+        if channel is self._channel:
+            return exchange_obj
+
+        # the exchange is already declared, so pool channels only need
+        # their own handle to publish to it
+        key = (channel, exchange_obj.name)
+        exch = self._publish_exchanges.get(key)
+        if exch is None:
+            exch = await channel.get_exchange(exchange_obj.name, ensure=False)
+            self._publish_exchanges[key] = exch
+        return exch
+
+    @staticmethod
+    async def _consume_bulks(
+        func: Callable[[List[aio_pika.IncomingMessage]], Awaitable[Any]],
+        messages: "asyncio.Queue[aio_pika.IncomingMessage]",
+        bulk: BulkConfig,
+    ) -> None:
+        # bulks are processed one by one in delivery order, so every delivery
+        # before the last one of a bulk is already settled or in that bulk
+        while True:
+            batch = [await messages.get()]
+            with anyio.move_on_after(bulk.timeout):
+                while len(batch) < bulk.max_size:
+                    batch.append(await messages.get())
+            await func(batch)
+
+    def _bulk_parser(
+        self,
+        parser: AsyncParser[aio_pika.IncomingMessage],
+    ) -> AsyncParser[List[aio_pika.IncomingMessage]]:
+        parser = parser or self._global_parser
+
+        async def parse_bulk(
+            messages: List[aio_pika.IncomingMessage],
+            original_parser: Callable[..., Awaitable[RabbitMessage]],
+        ) -> PropanMessage[List[RabbitMessage]]:
+            if parser is None:
+                items = [await self._parse_message(m) for m in messages]
+            else:
+                items = [await parser(m, self._parse_message) for m in messages]
+
+            return PropanMessage(
+                body=b"",
+                message_id=items[-1].message_id,
+                raw_message=items,
+            )
+
+        return parse_bulk
+
+    def _bulk_decoder(
+        self,
+        decoder: AsyncDecoder[aio_pika.IncomingMessage],
+    ) -> AsyncDecoder[List[aio_pika.IncomingMessage]]:
+        decoder = decoder or self._global_decoder
+
+        async def decode_bulk(
+            message: PropanMessage[List[RabbitMessage]],
+            original_decoder: Callable[..., Awaitable[DecodedMessage]],
+        ) -> List[DecodedMessage]:
+            decoded = []
+            for m in message.raw_message:
+                if decoder is None:
+                    m.decoded_body = await self._decode_message(m)
+                else:
+                    m.decoded_body = await decoder(m, self._decode_message)
+                decoded.append(m.decoded_body)
+            return decoded
+
+        return decode_bulk
+
+    async def _init_rpc_consumer(self) -> None:
+        # all RPC calls share one Direct Reply-to consumer,
+        # responses are routed to callers by their correlation_id
+        if self._rpc_queue is None:
+            async with self._rpc_lock:
+                if self._rpc_queue is None:  # pragma: no branch
+                    queue = await self._channel.get_queue(RABBIT_REPLY)
+                    await queue.consume(self._consume_response, no_ack=True)
+                    self._rpc_queue = queue
+
+    async def _consume_response(
+        self,
+        message: aio_pika.message.IncomingMessage,
+    ) -> None:
+        callback = self.response_callbacks.pop(message.correlation_id, None)
+        if callback is not None and not callback.done():
+            callback.set_result(await self._parse_message(message))
 
     async def _init_handler(
         self,
         handler: Handler,
+        channel: Optional[aio_pika.RobustChannel] = None,
     ) -> aio_pika.abc.AbstractRobustQueue:
-        queue = await self.declare_queue(handler.queue)
+        if channel is None:
+            queue = await self.declare_queue(handler.queue)
+        else:
+            # consumers run on the channel their queue object belongs to
+            queue = await channel.declare_queue(**model_to_dict(handler.queue))
+
         if handler.exchange is not None and handler.exchange.name != "default":
             exchange = await self.declare_exchange(handler.exchange)
             await queue.bind(
@@ -313,7 +584,15 @@ class RabbitBroker(
         @wraps(func)
         async def wrapper(message: RabbitMessage) -> T:
             pika_message = message.raw_message
-            if watcher is None:
+            if isinstance(pika_message, list):
+                context = WatcherContext(
+                    watcher or NotPushBackWatcher(),
+                    message,
+                    on_success=ack_bulk,
+                    on_error=nack_bulk,
+                    on_max=reject_bulk,
+                )
+            elif watcher is None:
                 context = pika_message.process()
             else:
                 context = WatcherContext(
@@ -327,10 +606,14 @@ class RabbitBroker(
             async with context:
                 r = await func(message)
                 if message.reply_to:
-                    await self.publish(
-                        message=r,
+                    # replies always go through the default exchange, so build
+                    # the message once and skip `publish` arguments resolution
+                    await self._channel.default_exchange.publish(
+                        message=self._validate_message(
+                            r,
+                            correlation_id=pika_message.correlation_id,
+                        ),
                         routing_key=message.reply_to,
-                        correlation_id=pika_message.correlation_id,
                     )
 
                 return r
@@ -353,16 +636,16 @@ class RabbitBroker(
                 DeliveryMode.PERSISTENT if persist else DeliveryMode.NOT_PERSISTENT
             )
 
-            message = aio_pika.Message(
-                message,
-                **{
-                    "delivery_mode": delivery_mode,
-                    "content_type": content_type,
-                    "reply_to": callback_queue or reply_to,
-                    "correlation_id": str(uuid4()),
-                    **message_kwargs,
-                },
-            )
+            kwargs: Dict[str, Any] = {
+                "delivery_mode": delivery_mode,
+                "content_type": content_type,
+                "reply_to": callback_queue or reply_to,
+                "correlation_id": str(uuid4()),
+            }
+            if message_kwargs:
+                kwargs.update(message_kwargs)
+
+            message = aio_pika.Message(message, **kwargs)
 
         return message
 
@@ -371,68 +654,58 @@ class RabbitBroker(
         return self._channel
 
 
-class RPCCallback:
-    def __init__(self, lock: anyio.Lock, broker: RabbitBroker):
-        self.lock = lock
-        self.broker = broker
-
-    async def __aenter__(self) -> Tuple[str, MemoryObjectReceiveStream]:
-        (
-            send_response_stream,
-            receive_response_stream,
-        ) = anyio.create_memory_object_stream(max_buffer_size=1)
-        await self.lock.acquire()
-
-        self.queue = callback_queue = await self.broker._channel.get_queue(RABBIT_REPLY)
-
-        async def handle_response(msg: RabbitMessage) -> None:
-            propan_message = await self.broker._parse_message(msg)
-            await send_response_stream.send(propan_message)
-
-        self.consumer_tag = await callback_queue.consume(handle_response, no_ack=True)
-
-        return callback_queue.name, receive_response_stream
-
-    async def __aexit__(
-        self,
-        exc_type: Optional[Type[BaseException]] = None,
-        exc_val: Optional[BaseException] = None,
-        exec_tb: Optional[TracebackType] = None,
-    ):
-        self.lock.release()
-        await self.queue.cancel(self.consumer_tag)
-
-
-@asynccontextmanager
-async def fake_context(reply_to: str) -> Tuple[str, None]:
-    yield reply_to, None
-
-
 async def ack(message: RabbitMessage) -> None:
     pika_message = message.raw_message
-    if (
-        pika_message._IncomingMessage__processed
-        or pika_message._IncomingMessage__no_ack
-    ):
+    if _is_settled(pika_message):
         return
     await pika_message.ack()
 
 
 async def nack(message: RabbitMessage) -> None:
     pika_message = message.raw_message
-    if (
-        pika_message._IncomingMessage__processed
-        or pika_message._IncomingMessage__no_ack
-    ):
+    if _is_settled(pika_message):
         return
     await pika_message.nack()
 
 
 async def reject(message: RabbitMessage) -> None:
     pika_message = message.raw_message
-    if (
-        pika_message._IncomingMessage__processed
-        or pika_message._IncomingMessage__no_ack
-    ):
+    if _is_settled(pika_message):
         return
     await pika_message.reject()
+
+
+async def ack_bulk(message: PropanMessage[List[RabbitMessage]]) -> None:
+    # a bulk is settled with one frame by its last delivery tag, unless the
+    # handler has settled the last message itself
+    *messages, last = message.raw_message
+    if _is_settled(last.raw_message):
+        for m in messages:
+            await ack(m)
+    else:
+        await last.raw_message.ack(multiple=True)
+
+
+async def nack_bulk(message: PropanMessage[List[RabbitMessage]]) -> None:
+    *messages, last = message.raw_message
+    if _is_settled(last.raw_message):
+        for m in messages:
+            await nack(m)
+    else:
+        await last.raw_message.nack(multiple=True)
+
+
+async def reject_bulk(message: PropanMessage[List[RabbitMessage]]) -> None:
+    *messages, last = message.raw_message
+    if _is_settled(last.raw_message):
+        for m in messages:
+            await reject(m)
+    else:
+        await last.raw_message.nack(multiple=True, requeue=False)
+
+
+def _is_settled(pika_message: aio_pika.IncomingMessage) -> bool:
+    return (
+        pika_message._IncomingMessage__processed
+        or pika_message._IncomingMessage__no_ack
+    )
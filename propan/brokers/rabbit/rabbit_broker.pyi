@@ -27,7 +27,12 @@ from propan.brokers._model.broker_usecase import AsyncDecoder, AsyncParser
 from propan.brokers._model.schemas import PropanMessage
 from propan.brokers.middlewares import BaseMiddleware
 from propan.brokers.push_back_watcher import BaseWatcher
-from propan.brokers.rabbit.schemas import Handler, RabbitExchange, RabbitQueue
+from propan.brokers.rabbit.schemas import (
+    BulkConfig,
+    Handler,
+    RabbitExchange,
+    RabbitQueue,
+)
 from propan.log import access_logger
 from propan.types import AnyDict, DecodedMessage, SendableMessage
 
@@ -67,6 +72,7 @@ class RabbitBroker(BrokerAsyncUsecase[IncomingMessage, aio_pika.RobustConnection
         log_fmt: Optional[str] = None,
         apply_types: bool = True,
         consumers: Optional[int] = None,
+        publish_channels: Optional[int] = None,
         dependencies: Sequence[Depends] = (),
         middlewares: Sequence[Type[BaseMiddleware[IncomingMessage]]] = (),
         decode_message: AsyncDecoder[IncomingMessage] = None,
@@ -98,6 +104,7 @@ class RabbitBroker(BrokerAsyncUsecase[IncomingMessage, aio_pika.RobustConnection
             log_fmt: custom log formatting string
             apply_types: wrap brokers handlers to FastDepends decorator
             consumers: max messages to proccess at the same time
+            publish_channels: number of extra channels to spread publishes over
             dependencies: dependencies applied to all broker hadlers
             decode_message: custom RabbitMessage decoder
             parse_message: custom IncomingMessage to RabbitMessage parser
@@ -208,6 +215,57 @@ class RabbitBroker(BrokerAsyncUsecase[IncomingMessage, aio_pika.RobustConnection
 
             `DecodedMessage` | `None` if response is expected
 
+        _publisher confirms: https://www.rabbitmq.com/confirms.html
+        """
+    async def publish_batch(
+        self,
+        *messages: PikaSendableMessage,
+        queue: Union[RabbitQueue, str] = "",
+        exchange: Union[RabbitExchange, str, None] = None,
+        # publish kwargs
+        routing_key: str = "",
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: aio_pika.abc.TimeoutType = None,
+        # message kwargs
+        headers: Optional[aio_pika.abc.HeadersType] = None,
+        content_type: Optional[str] = None,
+        content_encoding: Optional[str] = None,
+        persist: bool = False,
+        priority: Optional[int] = None,
+        expiration: Optional[aio_pika.abc.DateType] = None,
+        timestamp: Optional[aio_pika.abc.DateType] = None,
+        type: Optional[str] = None,
+        user_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+    ) -> List[aiormq.abc.ConfirmationFrameType]:
+        """Publish several messages to the exchange with the same routing key.
+
+        All messages are sent at once and publisher confirmations are awaited
+        together, so the batch costs about one round-trip instead of one per message.
+
+        Args:
+            messages: encodable messages to send
+            queue: if routing key is not set, use queue instead
+            exchange: exchange to publish messages. Use `default` if not specified
+            routing_key: messages routing key
+            mandatory: wait for messages will be placed in any queue
+            immediate: expects available consumer
+            timeout: request to RabbitMQ timeout
+            headers: messages headers (for consumers)
+            content_type: messages content-type to decode
+            content_encoding: messages encoding
+            persist: restore messages on RabbitMQ reboot
+            priority: messages priority
+            timestamp: messages sending time
+            expiration: messages lifetime (in seconds)
+            type: messages type (for consumers)
+            user_id: RabbitMQ user who sent the messages
+            app_id: application identifier (for consumers)
+
+        Returns:
+            `aiormq.abc.ConfirmationFrameType` for each message in the sending order
+
         _publisher confirms: https://www.rabbitmq.com/confirms.html
         """
     def handle(  # type: ignore[override]
@@ -216,6 +274,8 @@ class RabbitBroker(BrokerAsyncUsecase[IncomingMessage, aio_pika.RobustConnection
         exchange: Union[str, RabbitExchange, None] = None,
         *,
         consume_arguments: Optional[AnyDict] = None,
+        prefetch_count: Optional[int] = None,
+        bulk: Optional[BulkConfig] = None,
         retry: Union[bool, int] = False,
         dependencies: Sequence[Depends] = (),
         decode_message: AsyncDecoder[IncomingMessage] = None,
@@ -231,6 +291,14 @@ class RabbitBroker(BrokerAsyncUsecase[IncomingMessage, aio_pika.RobustConnection
         Args:
             queue: queue to consume messages
             exchange: exchange to bind queue
+            consume_arguments: custom consumer arguments
+            prefetch_count: max unacknowledged messages delivered to this consumer
+                (overrides broker `consumers`), the handler consumes on its own
+                channel. Higher values increase throughput at the cost of memory
+                to buffer the prefetched messages
+            bulk: collect up to `max_size` messages or wait `timeout` seconds,
+                call the handler once with the list of message bodies and
+                settle the whole bulk with a single `multiple=True` ack/nack
             retry: at message exception will returns to queue `int` times or endless if `True`
             dependencies: wrap handler dependencies
             decode_message: custom RabbitMessage decoder
@@ -13,7 +13,7 @@ from propan.brokers._model.broker_usecase import (
 )
 from propan.brokers._model.routing import BrokerRouter
 from propan.brokers._model.schemas import PropanMessage
-from propan.brokers.rabbit.schemas import RabbitExchange, RabbitQueue
+from propan.brokers.rabbit.schemas import BulkConfig, RabbitExchange, RabbitQueue
 from propan.types import AnyDict, SendableMessage
 
 PikaSendableMessage: TypeAlias = Union[aio_pika.message.Message, SendableMessage]
@@ -26,6 +26,8 @@ class RabbitRouter(BrokerRouter[IncomingMessage]):
         exchange: Union[str, RabbitExchange, None] = None,
         *,
         consume_arguments: Optional[AnyDict] = None,
+        prefetch_count: Optional[int] = None,
+        bulk: Optional[BulkConfig] = None,
         retry: Union[bool, int] = False,
         dependencies: Sequence[Depends] = (),
         decode_message: AsyncDecoder[IncomingMessage] = None,
@@ -3,7 +3,7 @@ from enum import Enum, unique
 from typing import Any, Dict, Optional, Union
 
 from fast_depends.core import CallModel
-from pydantic import Field
+from pydantic import BaseModel, Field
 from typing_extensions import TypeAlias
 
 from propan.asyncapi.bindings import (
@@ -141,11 +141,21 @@ class RabbitExchange(NameRequired):
         )
 
 
+class BulkConfig(BaseModel):
+    max_size: int = Field(gt=0)
+    timeout: float = Field(gt=0)
+
+    def __init__(self, max_size: int, timeout: float):
+        super().__init__(max_size=max_size, timeout=timeout)
+
+
 @dataclass
 class Handler(BaseHandler):
     queue: RabbitQueue
     exchange: Optional[RabbitExchange] = field(default=None)
     consume_arguments: AnyDict = field(default_factory=dict)
+    prefetch_count: Optional[int] = field(default=None)
+    bulk: Optional[BulkConfig] = field(default=None)
 
     def __init__(
         self,
@@ -154,6 +164,8 @@ class Handler(BaseHandler):
         queue: RabbitQueue,
         exchange: Optional[RabbitExchange] = None,
         consume_arguments: Optional[AnyDict] = None,
+        prefetch_count: Optional[int] = None,
+        bulk: Optional[BulkConfig] = None,
         _description: str = "",
     ):
         self.callback = callback
@@ -162,6 +174,8 @@ class Handler(BaseHandler):
         self.exchange = exchange
         self._description = _description
         self.consume_arguments = consume_arguments or {}
+        self.prefetch_count = prefetch_count
+        self.bulk = bulk
 
     def get_schema(self) -> Dict[str, AsyncAPIChannel]:
         message_title, body, reply_to = self.get_message_object()
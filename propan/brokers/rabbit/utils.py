@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional, Union, overload
 
 from propan.brokers.rabbit.schemas import RabbitExchange, RabbitQueue
@@ -55,3 +56,29 @@ def validate_queue(
                 f"Queue '{queue}' should be 'str' | 'RabbitQueue' instance"
             )
     return queue
+
+
+# publish() is called with the same queue / exchange names over and over,
+# so reuse the objects built from a plain name instead of revalidating them
+@lru_cache(maxsize=1024)
+def _get_queue(name: str) -> RabbitQueue:
+    return RabbitQueue(name=name)
+
+
+@lru_cache(maxsize=1024)
+def _get_exchange(name: str) -> RabbitExchange:
+    return RabbitExchange(name=name)
+
+
+def get_cached_queue(queue: Union[str, RabbitQueue]) -> RabbitQueue:
+    if isinstance(queue, str):
+        return _get_queue(queue)
+    return validate_queue(queue)
+
+
+def get_cached_exchange(
+    exchange: Union[str, RabbitExchange, None] = None,
+) -> Optional[RabbitExchange]:
+    if isinstance(exchange, str):
+        return _get_exchange(exchange)
+    return validate_exchange(exchange)
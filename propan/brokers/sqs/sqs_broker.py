@@ -30,6 +30,7 @@ from propan.brokers._model.broker_usecase import (
     T_HandlerReturn,
 )
 from propan.brokers._model.schemas import PropanMessage
+from propan.brokers._model.utils import skip_decode
 from propan.brokers.exceptions import SkipMessage
 from propan.brokers.push_back_watcher import (
     BaseWatcher,
@@ -217,6 +218,7 @@ class SQSBroker(BrokerAsyncUsecase[AnyDict, AioBaseClient]):
             self.handle(
                 self.response_queue,
                 _raw=True,
+                decode_message=skip_decode,
             )(self._consume_response)
 
         context.set_local(
@@ -21,7 +21,7 @@ from propan.brokers._model.broker_usecase import (
     HandlerCallable,
     T_HandlerReturn,
 )
-from propan.brokers.rabbit import RabbitExchange, RabbitQueue
+from propan.brokers.rabbit import BulkConfig, RabbitExchange, RabbitQueue
 from propan.fastapi.core import PropanRouter
 from propan.log import access_logger
 from propan.types import AnyDict
@@ -64,6 +64,7 @@ class RabbitRouter(PropanRouter[RabbitBroker]):
         log_fmt: Optional[str] = None,
         apply_types: bool = True,
         consumers: Optional[int] = None,
+        publish_channels: Optional[int] = None,
         decode_message: AsyncDecoder[IncomingMessage] = None,
         parse_message: AsyncParser[IncomingMessage] = None,
         schema_url: str = "/asyncapi",
@@ -90,6 +91,8 @@ class RabbitRouter(PropanRouter[RabbitBroker]):
         *,
         exchange: Union[str, RabbitExchange, None] = None,
         consume_arguments: Optional[AnyDict] = None,
+        prefetch_count: Optional[int] = None,
+        bulk: Optional[BulkConfig] = None,
         retry: Union[bool, int] = False,
         decode_message: AsyncDecoder[IncomingMessage] = None,
         parse_message: AsyncParser[IncomingMessage] = None,
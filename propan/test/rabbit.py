@@ -2,7 +2,7 @@ import re
 import sys
 from contextlib import asynccontextmanager
 from types import MethodType
-from typing import Any, Optional, Union
+from typing import Any, List, Optional, Union
 
 from propan.types import AnyDict
 
@@ -146,7 +146,7 @@ async def publish(
             if call:
                 r = await call_handler(
                     handler,
-                    incoming,
+                    incoming if handler.bulk is None else [incoming],
                     callback,
                     callback_timeout,
                     raise_timeout,
@@ -155,8 +155,36 @@ async def publish(
                     return r
 
 
+async def publish_batch(
+    self: RabbitBroker,
+    *messages: PikaSendableMessage,
+    queue: Union[RabbitQueue, str] = "",
+    exchange: Union[RabbitExchange, str, None] = None,
+    routing_key: str = "",
+    mandatory: bool = True,
+    immediate: bool = False,
+    timeout: TimeoutType = None,
+    **message_kwargs: AnyDict,
+) -> List[Any]:
+    return [
+        await self.publish(
+            m,
+            queue,
+            exchange,
+            routing_key=routing_key,
+            mandatory=mandatory,
+            immediate=immediate,
+            timeout=timeout,
+            **message_kwargs,
+        )
+        for m in messages
+    ]
+
+
 def TestRabbitBroker(broker: RabbitBroker) -> RabbitBroker:
+    broker._connection = AsyncMock()
     broker._channel = AsyncMock()
     broker.connect = AsyncMock()  # type: ignore
     broker.publish = MethodType(publish, broker)  # type: ignore
+    broker.publish_batch = MethodType(publish_batch, broker)  # type: ignore
     return broker
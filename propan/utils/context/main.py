@@ -40,8 +40,19 @@ class ContextRepo(Singleton):
         self._global_context = {}
         self._scope_context = {}
 
-    def get(self, key: str) -> Any:
-        return self.context.get(key)
+    def get(self, key: str, default: Any = None) -> Any:
+        # same lookup order as `context` without building the whole mapping
+        if key in self._global_context:
+            return self._global_context[key]
+
+        context_var = self._scope_context.get(key)
+        if context_var is not None:
+            return context_var.get()
+
+        if key == "context":
+            return self
+
+        return default
 
     def __getattr__(self, __name: str) -> Any:
         return self.get(__name)
@@ -37,7 +37,10 @@ class Context(CustomField):  # type: ignore
 def resolve_context(argument: str) -> Any:
     keys = argument.split(".")
 
-    v = context.context[keys[0]]
+    v = context.get(keys[0], _empty)
+    if v is _empty:
+        raise KeyError(keys[0])
+
     for i in keys[1:]:
         v = getattr(v, i)
 
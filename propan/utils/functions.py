@@ -1,6 +1,8 @@
+import asyncio
 import inspect
 from functools import wraps
-from typing import Awaitable, Callable, List, TypeVar, Union, cast
+from typing import Awaitable, Callable, List, Tuple, TypeVar, Union, cast
+from weakref import WeakKeyDictionary
 
 from fast_depends.utils import run_async as call_or_await
 from typing_extensions import ParamSpec
@@ -13,6 +15,16 @@ __all__ = (
 T = TypeVar("T")
 P = ParamSpec("P")
 
+_positional_arguments: "WeakKeyDictionary[Callable[..., object], Tuple[str, ...]]" = (
+    WeakKeyDictionary()
+)
+_POSITIONAL_KINDS = frozenset(
+    (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+)
+
 
 def to_async(
     func: Union[
@@ -20,6 +32,9 @@ def to_async(
         Callable[P, Awaitable[T]],
     ]
 ) -> Callable[P, Awaitable[T]]:
+    if asyncio.iscoroutinefunction(func):
+        return func
+
     @wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         r = await call_or_await(func, *args, **kwargs)
@@ -29,15 +44,28 @@ def to_async(
 
 
 def get_function_positional_arguments(func: Callable[P, T]) -> List[str]:
-    signature = inspect.signature(func)
+    # bound methods are created on each attribute access, so cache the
+    # underlying function and strip the bound `self` / `cls` argument
+    original = getattr(func, "__func__", func)
 
-    arg_kinds = (
-        inspect.Parameter.POSITIONAL_ONLY,
-        inspect.Parameter.POSITIONAL_OR_KEYWORD,
-    )
+    args = _positional_arguments.get(original)
+    if args is None:
+        args = _inspect_positional_arguments(original)
+        try:
+            _positional_arguments[original] = args
+        except TypeError:  # pragma: no cover
+            pass  # object does not support weak references
 
-    args = [
-        param.name for param in signature.parameters.values() if param.kind in arg_kinds
-    ]
+    if original is not func:
+        args = args[1:]
 
-    return args
+    return list(args)
+
+
+def _inspect_positional_arguments(func: Callable[..., object]) -> Tuple[str, ...]:
+    signature = inspect.signature(func)
+    return tuple(
+        param.name
+        for param in signature.parameters.values()
+        if param.kind in _POSITIONAL_KINDS
+    )
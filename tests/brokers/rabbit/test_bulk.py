@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from propan.brokers._model.schemas import PropanMessage
+from propan.brokers.rabbit.rabbit_broker import ack_bulk, nack_bulk, reject_bulk
+
+
+def build_bulk(*processed: bool) -> PropanMessage:
+    items = []
+    for p in processed:
+        raw = Mock(
+            _IncomingMessage__processed=p,
+            _IncomingMessage__no_ack=False,
+            ack=AsyncMock(),
+            nack=AsyncMock(),
+            reject=AsyncMock(),
+        )
+        items.append(PropanMessage(body=b"", raw_message=raw))
+    return PropanMessage(body=b"", raw_message=items)
+
+
+@pytest.mark.asyncio
+async def test_ack_bulk():
+    bulk = build_bulk(False, False, False)
+    first, second, last = (m.raw_message for m in bulk.raw_message)
+
+    await ack_bulk(bulk)
+
+    last.ack.assert_awaited_once_with(multiple=True)
+    first.ack.assert_not_awaited()
+    second.ack.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ack_bulk_last_settled():
+    bulk = build_bulk(False, True, True)
+    first, second, last = (m.raw_message for m in bulk.raw_message)
+
+    await ack_bulk(bulk)
+
+    first.ack.assert_awaited_once_with()
+    second.ack.assert_not_awaited()
+    last.ack.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_nack_bulk_last_settled():
+    bulk = build_bulk(False, True)
+    first, last = (m.raw_message for m in bulk.raw_message)
+
+    await nack_bulk(bulk)
+
+    first.nack.assert_awaited_once_with()
+    last.nack.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reject_bulk():
+    bulk = build_bulk(False, False)
+    first, last = (m.raw_message for m in bulk.raw_message)
+
+    await reject_bulk(bulk)
+
+    last.nack.assert_awaited_once_with(multiple=True, requeue=False)
+    first.reject.assert_not_awaited()
@@ -1,11 +1,17 @@
 import asyncio
+from typing import List
 from unittest.mock import Mock
 
 import pytest
 from aio_pika import Message
 
 from propan.annotations import RabbitMessage
-from propan.brokers.rabbit import RabbitBroker, RabbitExchange, RabbitQueue
+from propan.brokers.rabbit import (
+    BulkConfig,
+    RabbitBroker,
+    RabbitExchange,
+    RabbitQueue,
+)
 from tests.brokers.base.consume import BrokerConsumeTestcase
 
 
@@ -74,6 +80,65 @@ class TestRabbitConsume(BrokerConsumeTestcase):
 
         mock.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_consume_with_prefetch(
+        self,
+        mock: Mock,
+        queue: str,
+        broker: RabbitBroker,
+    ):
+        consume = asyncio.Event()
+        mock.side_effect = lambda *_: consume.set()  # pragma: no branch
+        broker.handle(queue=queue, prefetch_count=1)(mock)
+
+        async with broker:
+            await broker.start()
+
+            # robust channels restore their last QoS on reconnect
+            (channel,) = broker._handler_channels
+            assert channel is not broker.channel
+            assert channel._prefetch_count == 1
+            assert broker.channel._prefetch_count == 0
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(broker.publish("hello", queue=queue)),
+                    asyncio.create_task(consume.wait()),
+                ),
+                timeout=3,
+            )
+
+        mock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_consume_bulk(
+        self,
+        mock: Mock,
+        queue: str,
+        full_broker: RabbitBroker,
+    ):
+        consume = asyncio.Event()
+
+        @full_broker.handle(queue=queue, bulk=BulkConfig(max_size=3, timeout=1))
+        async def handler(m: List[int]):
+            mock(m)
+            consume.set()
+
+        async with full_broker:
+            await full_broker.start()
+            await asyncio.wait(
+                (
+                    asyncio.create_task(
+                        full_broker.publish_batch(1, 2, 3, queue=queue)
+                    ),
+                    asyncio.create_task(consume.wait()),
+                ),
+                timeout=3,
+            )
+
+        mock.assert_called_once()
+        assert sorted(mock.call_args.args[0]) == [1, 2, 3]
+
     @pytest.mark.asyncio
     async def test_consume_ack(
         self,
@@ -1,8 +1,78 @@
+import asyncio
+from unittest.mock import Mock
+
 import pytest
 
+from propan.brokers.rabbit import RabbitBroker
 from tests.brokers.base.publish import BrokerPublishTestcase
 
 
 @pytest.mark.rabbit
 class TestRabbitPublish(BrokerPublishTestcase):
-    pass
+    @pytest.mark.asyncio
+    async def test_publish_batch(
+        self,
+        mock: Mock,
+        queue: str,
+        full_broker: RabbitBroker,
+    ):
+        consume = asyncio.Event()
+
+        @full_broker.handle(queue)
+        async def handler(m: int):
+            mock(m)
+            if mock.call_count == 3:
+                consume.set()
+
+        async with full_broker:
+            await full_broker.start()
+            await asyncio.wait(
+                (
+                    asyncio.create_task(
+                        full_broker.publish_batch(1, 2, 3, queue=queue)
+                    ),
+                    asyncio.create_task(consume.wait()),
+                ),
+                timeout=3,
+            )
+
+        assert sorted(c.args[0] for c in mock.call_args_list) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_publish_channels_pool(
+        self,
+        mock: Mock,
+        queue: str,
+        settings,
+    ):
+        broker = RabbitBroker(settings.url, publish_channels=2)
+        consume = asyncio.Event()
+
+        @broker.handle(queue)
+        async def handler(m: int):
+            mock(m)
+            if mock.call_count == 3:
+                consume.set()
+
+        async with broker:
+            await broker.start()
+
+            assert len(broker._publish_channels) == 2
+            assert broker.channel not in broker._publish_channels
+
+            get_channel = Mock(wraps=broker._get_publish_channel)
+            broker._get_publish_channel = get_channel
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(broker.publish(1, queue)),
+                    asyncio.create_task(broker.publish(2, queue)),
+                    asyncio.create_task(broker.publish(3, queue)),
+                    asyncio.create_task(consume.wait()),
+                ),
+                timeout=3,
+            )
+
+            assert get_channel.call_count == 3
+
+        assert sorted(c.args[0] for c in mock.call_args_list) == [1, 2, 3]
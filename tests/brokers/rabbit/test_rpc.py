@@ -1,8 +1,28 @@
+import asyncio
+
 import pytest
 
+from propan.brokers.rabbit import RabbitBroker
 from tests.brokers.base.rpc import BrokerRPCTestcase, ReplyAndConsumeForbidden
 
 
 @pytest.mark.rabbit
 class TestRabbitRPC(BrokerRPCTestcase, ReplyAndConsumeForbidden):
-    pass
+    @pytest.mark.asyncio
+    async def test_concurrent_rpc(self, queue: str, full_broker: RabbitBroker):
+        @full_broker.handle(queue)
+        async def handler(m: int):  # pragma: no cover
+            await asyncio.sleep(0.1 * (3 - m))
+            return m
+
+        async with full_broker:
+            await full_broker.start()
+
+            r = await asyncio.gather(
+                *(
+                    full_broker.publish(i, queue, callback_timeout=3, callback=True)
+                    for i in range(3)
+                )
+            )
+            assert r == [0, 1, 2]
+            assert not full_broker.response_callbacks
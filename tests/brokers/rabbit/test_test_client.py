@@ -1,10 +1,12 @@
 import asyncio
+from typing import List
 from unittest.mock import Mock
 
 import pytest
 
 from propan.annotations import RabbitMessage
 from propan.brokers.rabbit import (
+    BulkConfig,
     ExchangeType,
     RabbitBroker,
     RabbitExchange,
@@ -37,6 +39,59 @@ class TestRabbitTestclient(BrokerTestclientTestcase):
         )
         assert None is await test_broker.publish("", exchange="test2", callback=True)
 
+    @pytest.mark.asyncio
+    async def test_publish_batch(
+        self,
+        test_broker: RabbitBroker,
+        queue: str,
+    ):
+        mock = Mock()
+
+        @test_broker.handle(queue)
+        async def handler(m: int):
+            mock(m)
+
+        r = await test_broker.publish_batch(1, 2, 3, queue=queue)
+
+        assert len(r) == 3
+        assert [c.args[0] for c in mock.call_args_list] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_start_with_prefetch(
+        self,
+        test_broker: RabbitBroker,
+        queue: str,
+    ):
+        mock = Mock()
+
+        @test_broker.handle(queue, prefetch_count=5)
+        async def handler(m):
+            mock(m)
+
+        async with test_broker:
+            await test_broker.start()
+            await test_broker.publish("hello", queue=queue)
+
+        mock.assert_called_once_with("hello")
+
+    @pytest.mark.asyncio
+    async def test_bulk(
+        self,
+        test_broker: RabbitBroker,
+        queue: str,
+    ):
+        mock = Mock()
+
+        @test_broker.handle(queue, bulk=BulkConfig(max_size=10, timeout=1))
+        async def handler(m: List[int]):
+            mock(m)
+
+        async with test_broker:
+            await test_broker.start()
+            await test_broker.publish(1, queue=queue)
+
+        mock.assert_called_once_with([1])
+
     @pytest.mark.asyncio
     async def test_fanout(
         self,
@@ -0,0 +1,48 @@
+import importlib.util
+import math
+import sys
+
+import pytest
+
+import propan._compat
+
+
+@pytest.fixture(params=["orjson", "json"])
+def compat(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+    spec = importlib.util.spec_from_file_location(
+        "propan._compat_test", propan._compat.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_json_backend(compat, request):
+    is_stdlib = request.node.callspec.params["compat"] == "json"
+    assert (compat.json_dumps is compat._json_dumps) is is_stdlib
+
+
+def test_json_roundtrip(compat):
+    assert compat.json_loads(compat.json_dumps({1: "a", "b": [1.5, None]})) == {
+        "1": "a",
+        "b": [1.5, None],
+    }
+
+
+def test_json_dumps_big_int(compat):
+    assert compat.json_dumps(2**70) == b"1180591620717411303424"
+
+
+def test_json_loads_non_finite(compat):
+    assert math.isnan(compat.json_loads(b'{"a": NaN}')["a"])
+    assert compat.json_loads(b"[Infinity]") == [math.inf]
+
+
+def test_json_loads_invalid(compat):
+    with pytest.raises(ValueError):
+        compat.json_loads(b"{")
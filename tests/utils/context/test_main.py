@@ -133,3 +133,12 @@ def test_scope(context: ContextRepo):
 
     assert context.get("key") is None
     assert context.get("key2") is None
+
+
+def test_get_default(context: ContextRepo):
+    assert context.get("key", 1) == 1
+
+    context.set_global("key", None)
+    assert context.get("key", 1) is None
+
+    assert context.get("context") is context
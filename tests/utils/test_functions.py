@@ -1,6 +1,10 @@
 import pytest
 
-from propan.utils.functions import call_or_await
+from propan.utils.functions import (
+    call_or_await,
+    get_function_positional_arguments,
+    to_async,
+)
 
 
 def sync_func(a):
@@ -19,3 +23,30 @@ async def test_call():
 @pytest.mark.asyncio
 async def test_await():
     assert (await call_or_await(async_func, a=3)) == 3
+
+
+@pytest.mark.asyncio
+async def test_to_async():
+    assert (await to_async(sync_func)(a=3)) == 3
+
+
+def test_to_async_coroutine():
+    assert to_async(async_func) is async_func
+
+
+class Connector:
+    def connect(self, url, port=5672, *, timeout=None):
+        ...
+
+
+def test_positional_arguments():
+    assert get_function_positional_arguments(Connector.connect) == [
+        "self",
+        "url",
+        "port",
+    ]
+
+
+def test_bound_method_positional_arguments():
+    assert get_function_positional_arguments(Connector().connect) == ["url", "port"]
+    assert get_function_positional_arguments(Connector().connect) == ["url", "port"]